@@ -1,2 +1,4 @@
-from .nau7802 import NAU7802
+from .nau7802 import NAU7802, Sample
 from .constants import *
+from .exceptions import NAU7802Error, NAU7802IOError, NAU7802TimeoutError
+from .registers import RegisterSnapshot
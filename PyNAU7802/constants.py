@@ -56,6 +56,16 @@ NAU7802_CTRL2_CAL_ERROR = 3
 NAU7802_CTRL2_CRS = 4
 NAU7802_CTRL2_CHS = 7
 
+""" Bits within the I2C_CONTROL register """
+NAU7802_I2C_CONTROL_BGPCP = 0
+NAU7802_I2C_CONTROL_TS = 1
+NAU7802_I2C_CONTROL_BOPGA = 2
+NAU7802_I2C_CONTROL_SI = 3
+NAU7802_I2C_CONTROL_WPD = 4
+NAU7802_I2C_CONTROL_SPE = 5
+NAU7802_I2C_CONTROL_FRD = 6
+NAU7802_I2C_CONTROL_CRSD = 7
+
 """ Bits within the PGA register """
 NAU7802_PGA_CHP_DIS = 0
 NAU7802_PGA_INV = 3
@@ -0,0 +1,13 @@
+###########################################
+# Exceptions
+###########################################
+class NAU7802Error(Exception):
+    """ Base class for all errors raised by the NAU7802 driver """
+
+
+class NAU7802IOError(NAU7802Error, OSError):
+    """ The sensor did not ACK, even after retrying and recovering the bus """
+
+
+class NAU7802TimeoutError(NAU7802Error, TimeoutError):
+    """ The sensor did not complete an operation in the allowed time """
@@ -1,20 +1,94 @@
 import time
+import warnings
+from typing import NamedTuple, Sequence
 
 import smbus2
 
 from .constants import *
+from .exceptions import NAU7802IOError, NAU7802TimeoutError
+from .registers import REGISTER_MAP_SIZE, RegisterSnapshot
+
+# Registers holding the user configuration, re-applied by recover()
+_CONFIG_REGISTERS = (NAU7802_PU_CTRL, NAU7802_CTRL1, NAU7802_CTRL2, NAU7802_I2C_CONTROL,
+                     NAU7802_ADC, NAU7802_PGA, NAU7802_PGA_PWR)
+
+# Status and self-clearing bits that must not be written back on recovery
+_VOLATILE_BITS = {
+    NAU7802_PU_CTRL: (1 << NAU7802_PU_CTRL_RR) | (1 << NAU7802_PU_CTRL_PUR) | (1 << NAU7802_PU_CTRL_CR),
+    NAU7802_CTRL2: (1 << NAU7802_CTRL2_CALS) | (1 << NAU7802_CTRL2_CAL_ERROR),
+}
+
+# Nominal conversion period of each sample rate, in seconds
+_SPS_PERIODS = {
+    NAU7802_SPS_10: 1/10,
+    NAU7802_SPS_20: 1/20,
+    NAU7802_SPS_40: 1/40,
+    NAU7802_SPS_80: 1/80,
+    NAU7802_SPS_320: 1/320,
+}
+
+# On-chip temperature sensor output, in volts at 25 degC and volts per degC
+_TEMPERATURE_SENSOR_V_25C = 0.109
+_TEMPERATURE_SENSOR_V_PER_C = 0.00036
+
+# Age after which a temperature is too old to compensate the zero offset, in seconds, without a temperature interval
+_TEMPERATURE_MAX_AGE = 60.0
+
+# Fraction of the nominal period the conversion period estimate may drift by
+_PERIOD_TOLERANCE = 0.1
+
+# Fraction of a period a sample may be read early, relative to its reconstructed conversion time
+_COUNT_MARGIN = 0.25
+
+# Fraction of the polling delay the reconstructed conversion time catches up on each sample,
+# before and after the period is estimated from the sample timestamps
+_TIMESTAMP_CREEP_NOMINAL = 0.5
+_TIMESTAMP_CREEP = 0.02
+
+# Samples needed before the period is estimated from their timestamps
+_PERIOD_MIN_SAMPLES = 16
+
 
 ###########################################
 # Classes
 ###########################################
+class Sample(NamedTuple):
+    """ A reading tagged with the time.monotonic() time it was acquired and the
+    number of conversions missed since the previous sample """
+    value: int
+    timestamp: float
+    missed: int
+
+
 class NAU7802:
     """ Class to communicate with the NAU7802 """
     _i2cPort: smbus2.SMBus = None
     _zeroOffset: int = 0
     _calibrationFactor: float = 1.0
+    _retries: int = 3
+    _retryDelay: float = 0.0005
+    _maxRetryDelay: float = 0.005
+    _autoRecover: bool = True
+    _recovering: bool = False
+    _nominalPeriod: float = _SPS_PERIODS[NAU7802_SPS_10]  # Power on default
+    _conversionPeriod: float = _SPS_PERIODS[NAU7802_SPS_10]
+    _lastSampleTime: float = None
+    _fitStart: float = 0.0
+    _conversionIndex: int = 0
+    _missedConversions: int = 0
+    _temperatureCoefficient: float = 0.0
+    _referenceTemperature: float = None
+    _lastTemperature: float = None
+    _lastTemperatureTime: float = None
+    _temperatureInterval: float = None
+
+    def __init__(self) -> None:
+        self._configuration = {}  # Last value written to each configuration register
+        self._periodFit = [0, 0, 0.0, 0, 0.0]  # Count, sum of k, sum of t, sum of k^2 and sum of k*t
 
     def begin(self, wire_port: smbus2.SMBus = smbus2.SMBus(1), initialize: bool = True) -> bool:
-        """ Check communication and initialize sensor """
+        """ Check communication and initialize sensor.
+        Returns false if the sensor does not ACK or a write fails, raises NAU7802IOError if a read fails """
         # Get user's options
         self._i2cPort = wire_port
 
@@ -47,36 +121,172 @@ class NAU7802:
         except OSError:
             return False  # Sensor did not ACK
 
+    def setRetryPolicy(self, retries: int = 3, retry_delay: float = 0.0005, max_retry_delay: float = 0.005,
+                       auto_recover: bool = True) -> None:
+        """ Set how many times a failed I2C transfer is retried, the initial delay between tries (doubled after
+        each failure, up to max_retry_delay) and whether to recover the device once the retries are exhausted """
+        self._retries = max(0, retries)
+        self._retryDelay = retry_delay
+        self._maxRetryDelay = max(retry_delay, max_retry_delay)
+        self._autoRecover = auto_recover
+
+    def recover(self) -> bool:
+        """ Check that the device ACK's again and re-apply the last configuration written to it.
+        Returns true if the device is back in its configured state """
+        self._recovering = True
+        try:
+            if not self.isConnected():
+                if not self.isConnected():
+                    return False
+
+            configuration = dict(self._configuration)
+            if not configuration:
+                return True  # Nothing configured yet, nothing to restore
+
+            if not self._lostConfiguration(configuration):
+                return True  # Only the bus glitched, the device kept its state and calibration
+
+            for register in sorted(configuration):
+                self._transfer(self._i2cPort.write_byte_data, register, configuration[register])
+
+            if configuration.get(NAU7802_PU_CTRL, 0) & (1 << NAU7802_PU_CTRL_PUA):
+                if not self.powerUp():
+                    return False
+
+            return self.calibrateAFE()  # The calibration registers are not kept, redo them
+        except NAU7802IOError:
+            return False
+        finally:
+            self._recovering = False
+
+    def _lostConfiguration(self, configuration: dict) -> bool:
+        """ Returns true if the control registers no longer hold the given configuration """
+        values = self._transfer(self._i2cPort.read_i2c_block_data, NAU7802_PU_CTRL, NAU7802_CTRL2 + 1)
+        for register_address in (NAU7802_PU_CTRL, NAU7802_CTRL1, NAU7802_CTRL2):
+            if register_address not in configuration:
+                continue
+            value = values[register_address] & ~_VOLATILE_BITS.get(register_address, 0)
+            if value != configuration[register_address]:
+                return True
+
+        return False
+
     def available(self) -> bool:
         """ Returns true if Cycle Ready bit is set (conversion is complete) """
         return self.getBit(NAU7802_PU_CTRL_CR, NAU7802_PU_CTRL)
 
     def getReading(self) -> int:
         """ Returns 24 bit reading. Assumes CR Cycle Ready bit
-        (ADC conversion complete) has been checked by .available() """
-        try:
-            value_list = self._i2cPort.read_i2c_block_data(DEVICE_ADDRESS, NAU7802_ADCO_B2, 3)
-        except OSError:
-            return False  # Sensor did not ACK
-
-        value = int.from_bytes(value_list, byteorder='big', signed=True)
-
-        return value
+        (ADC conversion complete) has been checked by .available().
+        Raises NAU7802IOError if the sensor does not ACK """
+        return self.getSample().value
+
+    def getSample(self) -> Sample:
+        """ Returns 24 bit reading tagged with its monotonic timestamp and the number of conversions missed
+        since the previous sample. Assumes CR Cycle Ready bit has been checked by .available().
+        The timestamp is the conversion time reconstructed from the estimated period, not the polling time. """
+        poll_time = time.monotonic()  # The conversion is complete before the transfer begins
+        value = self._readConversion()
+
+        timestamp, missed = self._trackConversion(poll_time)
+
+        return Sample(value, timestamp, missed)
+
+    def _readConversion(self) -> int:
+        """ Read the 24 bit conversion result without tracking its timing """
+        value_list = self._transfer(self._i2cPort.read_i2c_block_data, NAU7802_ADCO_B2, 3)
+        return int.from_bytes(value_list, byteorder='big', signed=True)
+
+    def getConversionPeriod(self) -> float:
+        """ Estimated time between two conversions, in seconds.
+        Starts at the nominal period and tracks the drift of the internal oscillator as samples are acquired. """
+        return self._conversionPeriod
+
+    def getMeasuredSampleRate(self) -> float:
+        """ Estimated number of conversions per second """
+        return 1/self._conversionPeriod
+
+    def getMissedConversions(self) -> int:
+        """ Number of conversions missed between samples since the last reset of the counter """
+        return self._missedConversions
+
+    def resetMissedConversions(self) -> None:
+        """ Reset the missed conversions counter """
+        self._missedConversions = 0
+
+    def _restartConversions(self, nominal_period: float = None) -> None:
+        """ Forget the previous sample timing, the conversions start over.
+        With a nominal period, the estimate also starts over from it. """
+        if nominal_period is not None:
+            self._nominalPeriod = nominal_period
+            self._conversionPeriod = nominal_period
+        self._lastSampleTime = None
+        self._periodFit = [0, 0, 0.0, 0, 0.0]
+
+    def _trackConversion(self, poll_time: float) -> tuple:
+        """ Count the conversions since the previous sample and refine the conversion period estimate.
+        Returns the reconstructed conversion time of the sample and the number of conversions missed. """
+        fit = self._periodFit
+        last_sample_time = self._lastSampleTime
+
+        if last_sample_time is None:
+            # First sample since the conversions (re)started, it is the time origin of the fit
+            self._lastSampleTime = poll_time
+            self._fitStart = poll_time
+            fit[:] = [1, 0, 0.0, 0, 0.0]
+            self._conversionIndex = 0
+            return poll_time, 0
+
+        # The sample is read after its conversion completed, but never before: round down, with some margin for
+        # the error of the reconstructed time. Cycle Ready was set, so at least one conversion completed.
+        periods = max(1, int((poll_time - last_sample_time)/self._conversionPeriod + _COUNT_MARGIN))
+
+        # Follow the earliest polling times, the closest to the actual conversion times
+        timestamp = last_sample_time + periods*self._conversionPeriod
+        creep = _TIMESTAMP_CREEP if fit[0] >= _PERIOD_MIN_SAMPLES else _TIMESTAMP_CREEP_NOMINAL
+        timestamp = min(poll_time, timestamp + creep*(poll_time - timestamp))
+        self._lastSampleTime = timestamp
+
+        # Least squares fit of the polling times against the conversion index, over all samples since the restart
+        self._conversionIndex += periods
+        k = self._conversionIndex
+        t = poll_time - self._fitStart
+        fit[0] += 1
+        fit[1] += k
+        fit[2] += t
+        fit[3] += k*k
+        fit[4] += k*t
+        count, sum_k, sum_t, sum_kk, sum_kt = fit
+        denominator = count*sum_kk - sum_k*sum_k
+        if count >= _PERIOD_MIN_SAMPLES and denominator > 0:
+            period = (count*sum_kt - sum_k*sum_t)/denominator
+            lowest = self._nominalPeriod*(1 - _PERIOD_TOLERANCE)
+            highest = self._nominalPeriod*(1 + _PERIOD_TOLERANCE)
+            self._conversionPeriod = min(max(period, lowest), highest)
+
+        missed = periods - 1
+        self._missedConversions += missed
+        return timestamp, missed
+
+    def getAverage(self, average_amount: int, timeout: float = 1.0) -> float:
+        """ Return the average of a given number of readings.
+        Raises NAU7802TimeoutError if they are not acquired within timeout seconds """
+        start_time = time.monotonic()
+
+        if self._temperatureInterval is not None and self._temperatureAge() > self._temperatureInterval:
+            self.getTemperature(timeout=timeout)  # Interleave a temperature conversion into the weight stream
 
-    def getAverage(self, average_amount: int) -> int:
-        """ Return the average of a given number of readings """
         total = 0
         samples_acquired = 0
 
-        start_time = time.time()
-
         while samples_acquired < average_amount:
             if self.available():
                 total += self.getReading()
                 samples_acquired += 1
 
-            if time.time() - start_time > 1.0:
-                return 0  # Timeout - Bail with error
+            if time.monotonic() - start_time > timeout:
+                raise NAU7802TimeoutError(f"Only {samples_acquired} of {average_amount} readings acquired "
+                                          f"in {timeout} s")
 
             time.sleep(0.001)
 
@@ -85,8 +295,14 @@ class NAU7802:
         return total
 
     def calculateZeroOffset(self, average_amount: int = 8) -> None:
-        """ Also called taring. Call this with nothing on the scale """
+        """ Also called taring. Call this with nothing on the scale.
+        With temperature compensation, the temperature becomes the reference temperature, measured again if the last
+        one is missing or stale. """
+        compensated = self._temperatureCoefficient != 0 or self._temperatureInterval is not None
+        if compensated and self._temperatureAge() > self._temperatureMaxAge():
+            self.getTemperature()
         self.setZeroOffset(self.getAverage(average_amount))
+        self.setReferenceTemperature(self._lastTemperature if compensated else None)
 
     def setZeroOffset(self, new_zero_offset: int) -> None:
         """ Sets the internal variable. Useful for users who are loading values from NVM. """
@@ -100,7 +316,7 @@ class NAU7802:
         """ Call this with the value of the thing on the scale.
         Sets the calibration factor based on the weight on scale and zero offset. """
         onScale = self.getAverage(average_amount)
-        newCalFactor = (onScale - self._zeroOffset)/weight_on_scale
+        newCalFactor = (onScale - self._compensatedZeroOffset())/weight_on_scale
         self.setCalibrationFactor(newCalFactor)
 
     def setCalibrationFactor(self, new_cal_factor: float) -> None:
@@ -114,18 +330,151 @@ class NAU7802:
     def getWeight(self, allow_negative_weights: bool = True, samples_to_take: int = 8) -> float:
         """ Once you 've set zero offset and cal factor, you can ask the library to do the calculations for you. """
         on_scale = self.getAverage(samples_to_take)
+        zero_offset = self._compensatedZeroOffset()
 
         # Prevent the current reading from being less than zero offset. This happens when the scale
         # is zero'd, unloaded, and the load cell reports a value slightly less than zero value
         # causing the weight to be negative or jump to millions of pounds
 
         if not allow_negative_weights:
-            if on_scale < self._zeroOffset:
-                on_scale = self._zeroOffset  # Force reading to zero
+            if on_scale < zero_offset:
+                on_scale = zero_offset  # Force reading to zero
 
-        weight = (on_scale - self._zeroOffset)/self._calibrationFactor
+        weight = (on_scale - zero_offset)/self._calibrationFactor
         return weight
 
+    def getTemperature(self, settle_conversions: int = 1, timeout: float = 1.0) -> float:
+        """ Measure the on-chip temperature sensor, in degC, between two load cell conversions.
+        The gain and input are switched for a single conversion, plus settle_conversions discarded on each switch,
+        then restored without a new AFE calibration. The conversions used are reported as missed by the next sample.
+        Raises NAU7802TimeoutError if the whole measurement takes more than timeout seconds. """
+        deadline = time.monotonic() + timeout
+
+        # The load cell input, as configured, even if a previous temperature conversion could not be undone
+        ctrl1 = self._configuration.get(NAU7802_CTRL1)
+        if ctrl1 is None:
+            ctrl1 = self.getRegister(NAU7802_CTRL1)
+        i2c_control = self._configuration.get(NAU7802_I2C_CONTROL)
+        if i2c_control is None:
+            i2c_control = self.getRegister(NAU7802_I2C_CONTROL)
+        i2c_control &= ~(1 << NAU7802_I2C_CONTROL_TS)
+
+        try:
+            # The configuration keeps the load cell input, the switch is not re-applied by recover().
+            # The sensor output is ~109 mV, only the x1 gain keeps it in range
+            self._transfer(self._i2cPort.write_byte_data, NAU7802_CTRL1, (ctrl1 & 0b11111000) | NAU7802_GAIN_1)
+            self._transfer(self._i2cPort.write_byte_data, NAU7802_I2C_CONTROL,
+                           i2c_control | (1 << NAU7802_I2C_CONTROL_TS))
+            self._settle(settle_conversions, deadline)
+            self._waitForConversion(deadline)
+            reading = self._readConversion()
+        finally:
+            self._restoreInput(ctrl1, i2c_control)
+
+        self._settle(settle_conversions, deadline)
+
+        # Full scale is +/- half the reference, which is the LDO voltage when the internal LDO is enabled
+        ldo_voltage = 4.5 - 0.3*((ctrl1 >> 3) & 0b111)
+        voltage = reading/(1 << 23)*ldo_voltage/2
+        temperature = 25 + (voltage - _TEMPERATURE_SENSOR_V_25C)/_TEMPERATURE_SENSOR_V_PER_C
+
+        self._lastTemperature = temperature
+        self._lastTemperatureTime = time.monotonic()
+        return temperature
+
+    def _restoreInput(self, ctrl1: int, i2c_control: int) -> None:
+        """ Put the load cell input back after a temperature conversion.
+        Raises NAU7802IOError if it could not be restored """
+        failed = []
+        for register_address, value in ((NAU7802_I2C_CONTROL, i2c_control), (NAU7802_CTRL1, ctrl1)):
+            self._configuration[register_address] = value  # recover() must restore the load cell input
+            if not self.setRegister(register_address, value):
+                failed.append(f"0x{register_address:02X}")
+
+        if failed:
+            raise NAU7802IOError(f"Could not restore register {', '.join(failed)} after the temperature conversion")
+
+    def setTemperatureInterval(self, interval: float = None) -> None:
+        """ Measure the temperature from getAverage(), and therefore getWeight(), when the last one is older than
+        interval seconds. None disables it. """
+        self._temperatureInterval = interval
+
+    def getTemperatureInterval(self) -> float:
+        """ Ask library for this value. """
+        return self._temperatureInterval
+
+    def _temperatureAge(self) -> float:
+        """ Seconds since the last temperature measurement, infinite if there is none """
+        if self._lastTemperatureTime is None:
+            return float("inf")
+        return time.monotonic() - self._lastTemperatureTime
+
+    def _temperatureMaxAge(self) -> float:
+        """ Age after which the last temperature is stale """
+        if self._temperatureInterval is not None:
+            return self._temperatureInterval
+        return _TEMPERATURE_MAX_AGE
+
+    def _settle(self, amount: int, deadline: float) -> None:
+        """ After an input switch, discard the conversion completed before it, if any,
+        then wait for and discard the given amount of fresh conversions """
+        if self.available():
+            self._readConversion()
+
+        for _ in range(amount):
+            self._waitForConversion(deadline)
+            self._readConversion()
+
+    def _waitForConversion(self, deadline: float) -> None:
+        """ Wait for the Cycle Ready bit to be set, until the time.monotonic() deadline """
+        while not self.available():
+            if time.monotonic() > deadline:
+                raise NAU7802TimeoutError("No conversion completed in time")
+            time.sleep(0.001)
+
+    def calculateTemperatureCoefficient(self, temperatures: Sequence[float], readings: Sequence[float]) -> None:
+        """ Call this with readings taken with nothing on the scale at various temperatures.
+        Sets the temperature coefficient to the least squares slope of the readings. """
+        if len(temperatures) != len(readings) or len(temperatures) < 2:
+            raise ValueError("At least two temperatures and as many readings are needed")
+
+        mean_temperature = sum(temperatures)/len(temperatures)
+        mean_reading = sum(readings)/len(readings)
+        covariance = sum((t - mean_temperature)*(r - mean_reading) for t, r in zip(temperatures, readings))
+        variance = sum((t - mean_temperature)**2 for t in temperatures)
+        if variance == 0:
+            raise ValueError("The readings must be taken at different temperatures")
+
+        self.setTemperatureCoefficient(covariance/variance)
+
+    def setTemperatureCoefficient(self, new_coefficient: float) -> None:
+        """ Pass a known drift of the zero offset, in counts per degC. Helpful if users is loading settings from NVM. """
+        self._temperatureCoefficient = new_coefficient
+
+    def getTemperatureCoefficient(self) -> float:
+        """ Ask library for this value. Useful for storing value into NVM. """
+        return self._temperatureCoefficient
+
+    def setReferenceTemperature(self, new_reference_temperature: float) -> None:
+        """ Temperature at which the zero offset was measured. Useful for users who are loading values from NVM. """
+        self._referenceTemperature = new_reference_temperature
+
+    def getReferenceTemperature(self) -> float:
+        """ Ask library for this value. Useful for storing value into NVM. """
+        return self._referenceTemperature
+
+    def _compensatedZeroOffset(self) -> float:
+        """ Zero offset corrected for the drift since the reference temperature,
+        using the last temperature measured with getTemperature() """
+        if self._referenceTemperature is None or self._lastTemperature is None:
+            return self._zeroOffset
+
+        if self._temperatureCoefficient != 0 and self._temperatureAge() > self._temperatureMaxAge():
+            warnings.warn(f"Compensating with a temperature measured {self._temperatureAge():.0f} s ago, "
+                          f"call getTemperature() or setTemperatureInterval()")
+
+        return self._zeroOffset + self._temperatureCoefficient*(self._lastTemperature - self._referenceTemperature)
+
     def setGain(self, gain_value: int) -> bool:
         """ Set the gain.x1, 2, 4, 8, 16, 32, 64, 128 are available """
         if gain_value > 0b111:
@@ -160,7 +509,10 @@ class NAU7802:
         value &= 0b10001111  # Clear CRS bits
         value |= rate << 4  # Mask in new CRS bits
 
-        return self.setRegister(NAU7802_CTRL2, value)
+        result = self.setRegister(NAU7802_CTRL2, value)
+        if result:
+            self._restartConversions(_SPS_PERIODS.get(rate, self._nominalPeriod))
+        return result
 
     def setChannel(self, channel_number: int) -> bool:
         """ Select between 1 and 2 """
@@ -179,15 +531,16 @@ class NAU7802:
         """ Begin asynchronous calibration of the analog front end of the NAU7802.
         Poll for completion with calAFEStatus() or wait with waitForCalibrateAFE(). """
         self.setBit(NAU7802_CTRL2_CALS, NAU7802_CTRL2)
+        self._restartConversions()
 
     def waitForCalibrateAFE(self, timeout_ms: int = 0) -> bool:
         """ Wait for asynchronous AFE calibration to complete with optional timeout. """
         timeout_s = timeout_ms/1000
-        begin = time.time()
+        begin = time.monotonic()
         cal_ready = self.calAFEStatus()
 
         while cal_ready == NAU7802_CAL_IN_PROGRESS:
-            if (timeout_ms > 0) & ((time.time() - begin) > timeout_s):
+            if (timeout_ms > 0) & ((time.monotonic() - begin) > timeout_s):
                 break
             time.sleep(0.001)
             cal_ready = self.calAFEStatus()
@@ -212,12 +565,16 @@ class NAU7802:
         """ Resets all registers to Power Of Defaults """
         self.setBit(NAU7802_PU_CTRL_RR, NAU7802_PU_CTRL)  # Set RR
         time.sleep(0.001)
-        return self.clearBit(NAU7802_PU_CTRL_RR, NAU7802_PU_CTRL)  # Clear RR to leave reset state
+        result = self.clearBit(NAU7802_PU_CTRL_RR, NAU7802_PU_CTRL)  # Clear RR to leave reset state
+        self._configuration.clear()  # All registers are back to their defaults
+        self._restartConversions(_SPS_PERIODS[NAU7802_SPS_10])
+        return result
 
     def powerUp(self) -> bool:
         """ Power up digital and analog sections of scale, ~2 mA """
         self.setBit(NAU7802_PU_CTRL_PUD, NAU7802_PU_CTRL)
         self.setBit(NAU7802_PU_CTRL_PUA, NAU7802_PU_CTRL)
+        self._restartConversions()
 
         # Wait for Power Up bit to be set - takes approximately 200us
         counter = 0
@@ -247,6 +604,57 @@ class NAU7802:
         revisionCode = self.getRegister(NAU7802_DEVICE_REV)
         return revisionCode & 0x0F
 
+    def getRegisterSnapshot(self, warm_cache: bool = False, read_adc: bool = False) -> RegisterSnapshot:
+        """ Read the whole register map in as few block transfers as possible.
+        The ADC result registers are skipped unless read_adc is set: reading them consumes a pending conversion,
+        which the next sample would report as missed.
+        With warm_cache, the driver state is also updated from the device: the configuration re-applied by
+        recover() and the conversion period estimate. """
+        if read_adc:
+            values = self._transfer(self._i2cPort.read_i2c_block_data, NAU7802_PU_CTRL, REGISTER_MAP_SIZE)
+        else:
+            values = self._transfer(self._i2cPort.read_i2c_block_data, NAU7802_PU_CTRL, NAU7802_ADCO_B2)
+            values += [0]*(NAU7802_ADC - NAU7802_ADCO_B2)
+            values += self._transfer(self._i2cPort.read_i2c_block_data, NAU7802_ADC, REGISTER_MAP_SIZE - NAU7802_ADC)
+        snapshot = RegisterSnapshot(bytes(values), adc_read=read_adc)
+
+        if warm_cache:
+            for register_address in _CONFIG_REGISTERS:
+                self._configuration[register_address] = \
+                    snapshot[register_address] & ~_VOLATILE_BITS.get(register_address, 0)
+            rate = snapshot.getField(NAU7802_CTRL2, NAU7802_CTRL2_CRS, 3)
+            if _SPS_PERIODS.get(rate, self._nominalPeriod) != self._nominalPeriod:
+                self._restartConversions(_SPS_PERIODS[rate])
+
+        return snapshot
+
+    def _transfer(self, operation, register_address: int, *args):
+        """ Run an I2C operation on the sensor, retrying with a bounded exponential backoff.
+        Once the retries are exhausted, recover the device and try one last time """
+        try:
+            return self._retry(operation, register_address, *args)
+        except NAU7802IOError:
+            if not self._autoRecover or self._recovering or not self.recover():
+                raise
+
+        return self._retry(operation, register_address, *args)
+
+    def _retry(self, operation, register_address: int, *args):
+        """ Run an I2C operation on the sensor until it ACK's or the retries are exhausted """
+        delay = self._retryDelay
+        for attempt in range(self._retries + 1):
+            try:
+                return operation(DEVICE_ADDRESS, register_address, *args)
+            except OSError as error:
+                last_error = error
+
+            if attempt < self._retries:
+                time.sleep(delay)
+                delay = min(delay*2, self._maxRetryDelay)
+
+        raise NAU7802IOError(f"Sensor did not ACK at register 0x{register_address:02X} "
+                             f"after {self._retries + 1} tries") from last_error
+
     def setBit(self, bit_number: int, register_address: int) -> bool:
         """ Mask & set a given bit within a register """
         value = self.getRegister(register_address)
@@ -266,18 +674,17 @@ class NAU7802:
         return bool(value)
 
     def getRegister(self, register_address: int) -> int:
-        """ Get contents of a register """
-        try:
-            return self._i2cPort.read_byte_data(DEVICE_ADDRESS, register_address)
-
-        except OSError:
-            return -1  # Sensor did not ACK
+        """ Get contents of a register. Raises NAU7802IOError if the sensor does not ACK """
+        return self._transfer(self._i2cPort.read_byte_data, register_address)
 
     def setRegister(self, register_address: int, value: int) -> bool:
         """ Send a given value to be written to given address.Return true if successful """
         try:
-            self._i2cPort.write_byte_data(DEVICE_ADDRESS, register_address, value)
-            return True
-
-        except OSError:
+            self._transfer(self._i2cPort.write_byte_data, register_address, value)
+        except NAU7802IOError:
             return False
+
+        if register_address in _CONFIG_REGISTERS:
+            self._configuration[register_address] = value & ~_VOLATILE_BITS.get(register_address, 0)
+
+        return True
@@ -0,0 +1,144 @@
+from typing import Dict, Optional, Tuple
+
+from .constants import *
+
+# Size of the register map, from 0x00 to 0x1F
+REGISTER_MAP_SIZE = NAU7802_DEVICE_REV + 1
+
+# Bit fields of each register as (name, lsb, width)
+_FIELDS = {
+    NAU7802_PU_CTRL: ("PU_CTRL", (
+        ("RR", NAU7802_PU_CTRL_RR, 1),
+        ("PUD", NAU7802_PU_CTRL_PUD, 1),
+        ("PUA", NAU7802_PU_CTRL_PUA, 1),
+        ("PUR", NAU7802_PU_CTRL_PUR, 1),
+        ("CS", NAU7802_PU_CTRL_CS, 1),
+        ("CR", NAU7802_PU_CTRL_CR, 1),
+        ("OSCS", NAU7802_PU_CTRL_OSCS, 1),
+        ("AVDDS", NAU7802_PU_CTRL_AVDDS, 1),
+    )),
+    NAU7802_CTRL1: ("CTRL1", (
+        ("GAIN", 0, 3),  # NAU7802_CTRL1_GAIN and NAU7802_CTRL1_VLDO hold the MSB of their field
+        ("VLDO", 3, 3),
+        ("DRDY_SEL", NAU7802_CTRL1_DRDY_SEL, 1),
+        ("CRP", NAU7802_CTRL1_CRP, 1),
+    )),
+    NAU7802_CTRL2: ("CTRL2", (
+        ("CALMOD", NAU7802_CTRL2_CALMOD, 2),
+        ("CALS", NAU7802_CTRL2_CALS, 1),
+        ("CAL_ERROR", NAU7802_CTRL2_CAL_ERROR, 1),
+        ("CRS", NAU7802_CTRL2_CRS, 3),
+        ("CHS", NAU7802_CTRL2_CHS, 1),
+    )),
+    NAU7802_I2C_CONTROL: ("I2C_CONTROL", (
+        ("BGPCP", NAU7802_I2C_CONTROL_BGPCP, 1),
+        ("TS", NAU7802_I2C_CONTROL_TS, 1),
+        ("BOPGA", NAU7802_I2C_CONTROL_BOPGA, 1),
+        ("SI", NAU7802_I2C_CONTROL_SI, 1),
+        ("WPD", NAU7802_I2C_CONTROL_WPD, 1),
+        ("SPE", NAU7802_I2C_CONTROL_SPE, 1),
+        ("FRD", NAU7802_I2C_CONTROL_FRD, 1),
+        ("CRSD", NAU7802_I2C_CONTROL_CRSD, 1),
+    )),
+    NAU7802_PGA: ("PGA", (
+        ("CHP_DIS", NAU7802_PGA_CHP_DIS, 1),
+        ("INV", NAU7802_PGA_INV, 1),
+        ("BYPASS_EN", NAU7802_PGA_BYPASS_EN, 1),
+        ("OUT_EN", NAU7802_PGA_OUT_EN, 1),
+        ("LDOMODE", NAU7802_PGA_LDOMODE, 1),
+        ("RD_OTP_SEL", NAU7802_PGA_RD_OTP_SEL, 1),
+    )),
+    NAU7802_PGA_PWR: ("PGA_PWR", (
+        ("PGA_CURR", NAU7802_PGA_PWR_PGA_CURR, 2),
+        ("ADC_CURR", NAU7802_PGA_PWR_ADC_CURR, 2),
+        ("MSTR_BIAS_CURR", NAU7802_PGA_PWR_MSTR_BIAS_CURR, 3),
+        ("PGA_CAP_EN", NAU7802_PGA_PWR_PGA_CAP_EN, 1),
+    )),
+    NAU7802_DEVICE_REV: ("DEVICE_REV", (
+        ("REVISION_ID", 0, 4),
+    )),
+}
+
+# Multi-byte values as (name, first register, length, signed)
+_VALUES = (
+    ("OCAL1", NAU7802_OCAL1_B2, 3, True),
+    ("GCAL1", NAU7802_GCAL1_B3, 4, False),
+    ("OCAL2", NAU7802_OCAL2_B2, 3, True),
+    ("GCAL2", NAU7802_GCAL2_B3, 4, False),
+    ("ADCO", NAU7802_ADCO_B2, 3, True),
+)
+
+# Single byte registers without bit fields
+_BYTES = {
+    NAU7802_ADC: "ADC",
+    NAU7802_OTP_B1: "OTP_B1",
+    NAU7802_OTP_B0: "OTP_B0",
+}
+
+
+###########################################
+# Classes
+###########################################
+class RegisterSnapshot:
+    """ Contents of the whole register map of the NAU7802, read at once.
+    Without adc_read, the ADC result registers were not read and their values are meaningless. """
+
+    def __init__(self, values: bytes, adc_read: bool = True) -> None:
+        if len(values) != REGISTER_MAP_SIZE:
+            raise ValueError(f"Expected {REGISTER_MAP_SIZE} register values, got {len(values)}")
+
+        self.values = bytes(values)
+        self.adc_read = adc_read
+
+    def __getitem__(self, register_address: int) -> int:
+        """ Raw contents of a register """
+        if not self.adc_read and NAU7802_ADCO_B2 <= register_address <= NAU7802_ADCO_B0:
+            raise ValueError(f"Register 0x{register_address:02X} was not read")
+        return self.values[register_address]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RegisterSnapshot):
+            return NotImplemented
+        return self.decode() == other.decode()
+
+    def __repr__(self) -> str:
+        return f"RegisterSnapshot({self.values.hex()}, adc_read={self.adc_read})"
+
+    def getField(self, register_address: int, lsb: int, width: int = 1) -> int:
+        """ Value of a bit field within a register """
+        return (self.values[register_address] >> lsb) & ((1 << width) - 1)
+
+    def decode(self) -> Dict[str, Optional[int]]:
+        """ Named view of the registers. Bit fields are named REGISTER.FIELD, multi-byte values by their register
+        prefix and registers without a known meaning by their address. ADCO is None if it was not read. """
+        decoded = {}
+        for register_address in range(REGISTER_MAP_SIZE):
+            if register_address in _FIELDS:
+                register_name, fields = _FIELDS[register_address]
+                for field_name, lsb, width in fields:
+                    decoded[f"{register_name}.{field_name}"] = self.getField(register_address, lsb, width)
+
+            elif register_address in _BYTES:
+                decoded[_BYTES[register_address]] = self.values[register_address]
+
+            else:
+                for name, first_register, length, signed in _VALUES:
+                    if register_address == first_register == NAU7802_ADCO_B2 and not self.adc_read:
+                        decoded[name] = None
+                        break
+                    if register_address == first_register:
+                        decoded[name] = int.from_bytes(self.values[first_register:first_register + length],
+                                                       byteorder='big', signed=signed)
+                        break
+                    if first_register < register_address < first_register + length:
+                        break  # Part of a multi-byte value already decoded
+                else:
+                    decoded[f"0x{register_address:02X}"] = self.values[register_address]
+
+        return decoded
+
+    def diff(self, other: "RegisterSnapshot") -> Dict[str, Tuple[Optional[int], Optional[int]]]:
+        """ Named fields that differ from another snapshot, as (this value, other value) """
+        mine = self.decode()
+        theirs = other.decode()
+        return {name: (value, theirs[name]) for name, value in mine.items() if theirs[name] != value}